@@ -20,8 +20,10 @@ import tempfile
 import unittest
 import threading
 import itertools
+import functools
 import contextlib
 import subprocess
+import concurrent.futures
 import collections
 import numpy as np
 
@@ -86,6 +88,13 @@ try:
 except BaseException as E:
     jsonschema = trimesh.exceptions.ExceptionWrapper(E)
 
+try:
+    # much faster parsing for large GLTF headers
+    # and accepts `bytes` the same as `json.loads`
+    from orjson import loads as json_loads
+except BaseException:
+    json_loads = json.loads
+
 # make sure functions know they should run additional
 # potentially slow validation checks and raise exceptions
 trimesh.util._STRICT = True
@@ -258,6 +267,35 @@ def get_mesh(file_name, *args, **kwargs):
     return list(meshes)
 
 
+def get_mesh_cached(file_name, **kwargs):
+    """
+    Get a copy of a mesh from the models directory, only
+    parsing the file the first time it is requested.
+
+    Parameters
+    -------------
+    file_name : str
+      Name of model in /models/
+    **kwargs : dict
+      Passed to `trimesh.load`, must be hashable.
+
+    Returns
+    -----------
+    mesh : trimesh.Trimesh, trimesh.Scene, etc
+      A copy of the loaded geometry which is safe to modify.
+    """
+    return _load_cached(file_name, **kwargs).copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cached(file_name, **kwargs):
+    """
+    Load a model by name and keep the result for the session,
+    callers should use `get_mesh_cached` which returns copies.
+    """
+    return get_mesh(file_name, **kwargs)
+
+
 def get_path(file_name):
     """
     Get the absolute location of a referenced model file.
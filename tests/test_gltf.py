@@ -6,8 +6,18 @@ except BaseException:
 # Khronos' official file validator
 # can be installed with the helper script:
 # `trimesh/docker/builds/gltf_validator.bash`
+# note that it has no persistent or streaming mode so every
+# validation is a new process: dedupe calls rather than batch them
 _gltf_validator = g.shutil.which("gltf_validator")
 
+# the validator picks a parser from the file extension and can't
+# read from stdin, so put the temporary GLB on a memory-backed
+# filesystem where one exists to avoid hitting the disk
+_temp_dir = "/dev/shm" if g.os.path.isdir("/dev/shm") else None
+
+# hashes of GLB exports which have already passed validation
+_validated = set()
+
 
 def validate_glb(data, name=None):
     """
@@ -30,7 +40,12 @@ def validate_glb(data, name=None):
         g.log.warning("no gltf_validator!")
         return
 
-    with g.tempfile.NamedTemporaryFile(suffix=".glb") as f:
+    # identical exports don't need to be validated twice
+    hashed = g.trimesh.caching.hash_fast(data)
+    if hashed in _validated:
+        return
+
+    with g.tempfile.NamedTemporaryFile(suffix=".glb", dir=_temp_dir) as f:
         f.write(data)
         f.flush()
 
@@ -52,6 +67,131 @@ def validate_glb(data, name=None):
 
         raise ValueError("gltf_validator failed")
 
+    _validated.add(hashed)
+
+
+def validate_reload(export, name=None, **kwargs):
+    """
+    Reload a GLB export while it is checked by the Khronos
+    validator, which runs in a subprocess so the two overlap.
+
+    Parameters
+    ------------
+    export : bytes
+      GLB export
+    name : str or None
+      Hint to log.
+    **kwargs : dict
+      Passed to `trimesh.load`
+
+    Returns
+    ------------
+    reloaded : trimesh.Scene or trimesh.Trimesh
+      The loaded GLB export.
+
+    Raises
+    ------------
+    ValueError
+      If Khronos validator reports errors.
+    """
+    if _gltf_validator is None:
+        # nothing to overlap so skip the thread
+        validate_glb(export, name=name)
+        return g.trimesh.load(
+            g.trimesh.util.wrap_as_stream(export), file_type="glb", **kwargs
+        )
+
+    with g.concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        validated = pool.submit(validate_glb, export, name=name)
+        try:
+            reloaded = g.trimesh.load(
+                g.trimesh.util.wrap_as_stream(export), file_type="glb", **kwargs
+            )
+        finally:
+            # raise any validation errors even if the load failed
+            validated.result()
+
+    return reloaded
+
+
+def _check_bulk(path_in, every=1):
+    """
+    Load a model, export it as a GLB, validate it and then
+    check that it reloads. Used by `test_bulk` to check
+    models in a thread pool.
+
+    Parameters
+    ------------
+    path_in : str
+      Location of a model file.
+    every : int
+      Only validate exports whose content hash is a
+      multiple of this, where `1` validates every export.
+
+    Returns
+    ------------
+    checked : bool
+      If the model was loadable and was checked.
+    """
+    try:
+        geom = g.trimesh.load(path_in)
+        if isinstance(geom, g.trimesh.path.path.Path):
+            geom = g.trimesh.Scene(geom)
+    except BaseException as E:
+        g.log.debug(E)
+        return False
+    # voxels don't have an export to gltf mode
+    if isinstance(geom, g.trimesh.voxel.VoxelGrid):
+        try:
+            geom.export(file_type="glb")
+        except ValueError:
+            # should have raised so all good
+            return False
+        raise ValueError("voxel was allowed to export wrong GLB!")
+    if hasattr(geom, "vertices") and len(geom.vertices) == 0:
+        return False
+    if hasattr(geom, "geometry") and len(geom.geometry) == 0:
+        return False
+
+    fn = g.os.path.basename(path_in)
+    g.log.info(f"Testing: {fn}")
+    # check a roundtrip which will validate on export
+    # and crash on reload if we've done anything screwey
+    # unitize normals will unitize any normals to comply with
+    # the validator although there are probably reasons you'd
+    # want to roundtrip non-unit normals for things, stuff, and
+    # activities
+    export = geom.export(file_type="glb", unitize_normals=True)
+
+    # shouldn't crash on a reload
+    if g.trimesh.caching.hash_fast(export) % every == 0:
+        reloaded = validate_reload(export, name=fn)
+    else:
+        reloaded = g.trimesh.load(
+            file_obj=g.trimesh.util.wrap_as_stream(export), file_type="glb"
+        )
+
+    if isinstance(geom, g.trimesh.Trimesh):
+        assert g.np.isclose(geom.area, reloaded.area)
+
+    # compute some stuff
+    assert isinstance(reloaded.area, float)
+    assert isinstance(reloaded.duplicate_nodes, list)
+
+    return True
+
+
+def _has_ref(item):
+    """
+    Check a loaded JSON schema for any `$ref` keys without
+    serializing the whole thing, stopping at the first one.
+    """
+    if isinstance(item, dict):
+        return "$ref" in item or any(_has_ref(v) for v in item.values())
+    if isinstance(item, list):
+        return any(_has_ref(v) for v in item)
+    return False
+
 
 class GLTFTest(g.unittest.TestCase):
     def test_duck(self):
@@ -70,10 +210,9 @@ class GLTFTest(g.unittest.TestCase):
         assert not geom.is_volume
         # make sure export doesn't crash
         export = scene.export(file_type="glb")
-        validate_glb(export, "Duck.glb")
 
         # check a roundtrip
-        reloaded = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        reloaded = validate_reload(export, "Duck.glb")
         # make basic assertions
         g.scene_equal(scene, reloaded)
 
@@ -91,38 +230,40 @@ class GLTFTest(g.unittest.TestCase):
     def test_buffer_dedupe(self):
         scene = g.trimesh.Scene()
         box_1 = g.trimesh.creation.box()
-        box_2 = g.trimesh.creation.box()
-        box_3 = g.trimesh.creation.box()
+        # identical copies should share buffers
+        box_2 = box_1.copy()
+        box_3 = box_1.copy()
         box_3.visual.face_colors = [0, 255, 0, 255]
 
         tm = g.trimesh.transformations.translation_matrix
         scene.add_geometry(box_1, "box_1", transform=tm((1, 1, 1)))
         scene.add_geometry(box_2, "box_2", transform=tm((-1, -1, -1)))
         scene.add_geometry(box_3, "box_3", transform=tm((-1, 20, -1)))
-        a = g.json.loads(scene.export(file_type="gltf")["model.gltf"].decode("utf-8"))
+        a = g.json_loads(scene.export(file_type="gltf")["model.gltf"])
         assert len(a["buffers"]) <= 3
 
+        # every box should reference the same position and index data
+        # with only the colors of `box_3` adding another accessor
+        primitives = [m["primitives"][0] for m in a["meshes"]]
+        assert len({p["indices"] for p in primitives}) == 1
+        assert len({p["attributes"]["POSITION"] for p in primitives}) == 1
+        assert len(a["accessors"]) == 3
+
     def test_skip_materials(self):
         # load textured PLY
-        mesh = g.get_mesh("fuze.ply")
+        mesh = g.get_mesh_cached("fuze.ply")
         g.check_fuze(mesh)
 
         # load as GLB
         export = mesh.export(file_type="glb", unitize_normals=True)
-        validate_glb(export)
-        mesh_glb = g.trimesh.load(
-            g.trimesh.util.wrap_as_stream(export),
-            file_type="glb",
-            force="mesh",
-            skip_materials=True,
-        )
+        mesh_glb = validate_reload(export, force="mesh", skip_materials=True)
 
         # visuals should not be present
         assert not mesh_glb.visual.defined
 
     def test_tex_export(self):
         # load textured PLY
-        mesh = g.get_mesh("fuze.ply")
+        mesh = g.get_mesh_cached("fuze.ply")
         assert hasattr(mesh.visual, "uv")
 
         # make sure export as GLB doesn't crash on scenes
@@ -135,7 +276,7 @@ class GLTFTest(g.unittest.TestCase):
     def test_cesium(self):
         # A GLTF with a multi- primitive mesh
 
-        s = g.get_mesh("CesiumMilkTruck.glb")
+        s = g.get_mesh_cached("CesiumMilkTruck.glb")
         # should be one Trimesh object per GLTF "primitive"
         assert len(s.geometry) == 4
         # every geometry displayed once, except wheels twice
@@ -143,9 +284,8 @@ class GLTFTest(g.unittest.TestCase):
 
         # make sure export doesn't crash
         export = s.export(file_type="glb")
-        validate_glb(export)
 
-        reloaded = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        reloaded = validate_reload(export)
         # make basic assertions
         g.scene_equal(s, reloaded)
 
@@ -164,10 +304,9 @@ class GLTFTest(g.unittest.TestCase):
         assert s.geometry["TestOpaqueMesh"].visual.material.alphaMode is None
 
         export = s.export(file_type="glb")
-        validate_glb(export)
 
         # roundtrip it
-        rs = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        rs = validate_reload(export)
 
         # make basic assertions
         g.scene_equal(s, rs)
@@ -188,7 +327,7 @@ class GLTFTest(g.unittest.TestCase):
         # Trimesh will store units as a GLTF extra if they
         # are defined so check that.
 
-        original = g.get_mesh("pins.glb")
+        original = g.get_mesh_cached("pins.glb")
 
         # export it as a a GLB file
         export = original.export(file_type="glb")
@@ -224,7 +363,7 @@ class GLTFTest(g.unittest.TestCase):
 
     def test_basic(self):
         # split a multibody mesh into a scene
-        scene = g.trimesh.scene.split_scene(g.get_mesh("cycloidal.ply"))
+        scene = g.trimesh.scene.split_scene(g.get_mesh_cached("cycloidal.ply"))
         # should be 117 geometries
         assert len(scene.geometry) >= 117
 
@@ -242,6 +381,22 @@ class GLTFTest(g.unittest.TestCase):
             file_obj=g.trimesh.util.wrap_as_stream(zipped), file_type="zip"
         )
 
+    def test_basic_disk(self):
+        # a few separate bodies as a loose GLTF with multiple buffers
+        c = g.trimesh.creation
+        bodies = g.trimesh.util.concatenate(
+            [
+                m.apply_translation([i * 5.0, 0, 0])
+                for i, m in enumerate(
+                    [c.box(), c.icosphere(), c.capsule(), c.cylinder(1.0, 1.0)]
+                )
+            ]
+        )
+        scene = g.trimesh.scene.split_scene(bodies)
+        assert len(scene.geometry) == 4
+        export = scene.export(file_type="gltf")
+        assert len(export) > 2
+
         # try loading from a file name
         # will require a file path resolver
         with g.TemporaryDirectory() as d:
@@ -255,7 +410,7 @@ class GLTFTest(g.unittest.TestCase):
 
     def test_merge_buffers(self):
         # split a multibody mesh into a scene
-        scene = g.trimesh.scene.split_scene(g.get_mesh("cycloidal.ply"))
+        scene = g.trimesh.scene.split_scene(g.get_mesh_cached("cycloidal.ply"))
 
         # export a gltf with the merge_buffers option set to true
         export = scene.export(file_type="gltf", merge_buffers=True)
@@ -275,11 +430,11 @@ class GLTFTest(g.unittest.TestCase):
 
     def test_merge_primitives(self):
         # test to see if the `merge_primitives` logic is working
-        a = g.get_mesh("CesiumMilkTruck.glb")
+        a = g.get_mesh_cached("CesiumMilkTruck.glb")
         assert len(a.geometry) == 4
 
         # should combine the multiple primitives into a single mesh
-        b = g.get_mesh("CesiumMilkTruck.glb", merge_primitives=True)
+        b = g.get_mesh_cached("CesiumMilkTruck.glb", merge_primitives=True)
         assert len(b.geometry) == 2
 
     def test_specular_glossiness(self):
@@ -341,7 +496,7 @@ class GLTFTest(g.unittest.TestCase):
     def test_write_dir(self):
         # try loading from a file name
         # will require a file path resolver
-        original = g.get_mesh("fuze.obj")
+        original = g.get_mesh_cached("fuze.obj")
         assert isinstance(original, g.trimesh.Trimesh)
         s = original.scene()
         with g.TemporaryDirectory() as d:
@@ -389,15 +544,13 @@ class GLTFTest(g.unittest.TestCase):
         box = g.trimesh.creation.box([1, 1, 1])
         scene = g.trimesh.Scene(box)
         export = scene.export(file_type="gltf")
-        assert gltf_cameras_key not in g.json.loads(export["model.gltf"].decode("utf8"))
+        assert gltf_cameras_key not in g.json_loads(export["model.gltf"])
 
         # `scene.camera` creates a camera if it does not exist.
         # once in the scene, it should be added to the gltf.
-        box = g.trimesh.creation.box([1, 1, 1])
-        scene = g.trimesh.Scene(box)
         scene.set_camera()
         export = scene.export(file_type="gltf")
-        assert gltf_cameras_key in g.json.loads(export["model.gltf"].decode("utf8"))
+        assert gltf_cameras_key in g.json_loads(export["model.gltf"])
 
     def test_gltf_pole(self):
         scene = g.get_mesh("simple_pole.glb")
@@ -406,9 +559,8 @@ class GLTFTest(g.unittest.TestCase):
         assert len(scene.geometry) == 11
 
         export = scene.export(file_type="glb")
-        validate_glb(export)
         # check a roundtrip
-        reloaded = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        reloaded = validate_reload(export)
         # make basic assertions
         g.scene_equal(scene, reloaded)
 
@@ -427,10 +579,7 @@ class GLTFTest(g.unittest.TestCase):
             args["materials"][0]["pbrMetallicRoughness"]["baseColorFactor"] = [1, 0, 0, 1]
 
         export = scene.export(file_type="glb", tree_postprocessor=to_integer)
-        validate_glb(export)
-        reloaded = g.trimesh.load(
-            file_obj=g.trimesh.util.wrap_as_stream(export), file_type="glb"
-        )
+        reloaded = validate_reload(export)
         assert len(reloaded.geometry) == 1
         # get meshes back
         sphere_b = next(iter(reloaded.geometry.values()))
@@ -451,10 +600,8 @@ class GLTFTest(g.unittest.TestCase):
         # create a scene with two meshes
         scene = g.trimesh.Scene([a, b])
         # get the exported GLTF header of a scene with both meshes
-        header = g.json.loads(
-            scene.export(file_type="gltf", unitize_normals=True)["model.gltf"].decode(
-                "utf-8"
-            )
+        header = g.json_loads(
+            scene.export(file_type="gltf", unitize_normals=True)["model.gltf"]
         )
         # header should contain exactly one material
         assert len(header["materials"]) == 1
@@ -463,10 +610,7 @@ class GLTFTest(g.unittest.TestCase):
 
         # get a reloaded version
         export = scene.export(file_type="glb", unitize_normals=True)
-        validate_glb(export)
-        reloaded = g.trimesh.load(
-            file_obj=g.trimesh.util.wrap_as_stream(export), file_type="glb"
-        )
+        reloaded = validate_reload(export)
 
         # meshes should have survived
         assert len(reloaded.geometry) == 2
@@ -490,11 +634,10 @@ class GLTFTest(g.unittest.TestCase):
         # an export-import cycle.
 
         # a scene
-        s = g.get_mesh("cycloidal.3DXML")
+        s = g.get_mesh_cached("cycloidal.3DXML")
         # export as GLB then re-load
         export = s.export(file_type="glb")
-        validate_glb(export)
-        r = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        r = validate_reload(export)
         # make sure we have the same geometries before and after
         assert set(s.geometry.keys()) == set(r.geometry.keys())
         # make sure the node names are the same before and after
@@ -536,22 +679,29 @@ class GLTFTest(g.unittest.TestCase):
         )
 
         # lightly check to see that no references exist
-        assert "$ref" not in g.json.dumps(s)
+        assert not _has_ref(s)
+
+        # schema is cached so make sure we were handed a copy
+        s["properties"].pop("accessors")
+        assert "accessors" in g.trimesh.exchange.gltf.get_schema()["properties"]
 
     def test_export_custom_attributes(self):
         # Write and read custom vertex attributes to gltf
         sphere = g.trimesh.primitives.Sphere()
         v_count, _ = sphere.vertices.shape
+        # seeded and generated directly in the target dtypes
+        rng = g.np.random.default_rng(0)
 
-        sphere.vertex_attributes["_CustomFloat32Scalar"] = g.np.random.rand(
-            v_count, 1
-        ).astype(g.np.float32)
-        sphere.vertex_attributes["_CustomFloat32Vec3"] = g.np.random.rand(
-            v_count, 3
-        ).astype(g.np.float32)
-        sphere.vertex_attributes["_CustomFloat32Mat4"] = g.np.random.rand(
-            v_count, 4, 4
-        ).astype(g.np.float32)
+        sphere.vertex_attributes["_CustomFloat32Scalar"] = rng.random(
+            (v_count, 1), dtype=g.np.float32
+        )
+        sphere.vertex_attributes["_CustomFloat32Vec3"] = rng.random(
+            (v_count, 3), dtype=g.np.float32
+        )
+        # keep the full matrix shape to check the MAT4 accessor type
+        sphere.vertex_attributes["_CustomFloat32Mat4"] = rng.random(
+            (v_count, 4, 4), dtype=g.np.float32
+        )
 
         # export as GLB bytes
         export = sphere.export(file_type="glb")
@@ -561,20 +711,20 @@ class GLTFTest(g.unittest.TestCase):
         # uint32 is slightly off-label and may cause
         # validators to fail but if you're a bad larry who
         # doesn't follow the rules it should be fine
-        sphere.vertex_attributes["_CustomUInt32Scalar"] = g.np.random.randint(
-            0, 1000, size=(v_count, 1)
-        ).astype(g.np.uint32)
+        sphere.vertex_attributes["_CustomUInt32Scalar"] = rng.integers(
+            0, 1000, size=(v_count, 1), dtype=g.np.uint32
+        )
 
         # when you add a uint16/int16 the gltf-validator
         # complains about the 4-byte boundaries even though
         # all their lengths and offsets mod 4 are zero
         # not sure if that's a validator bug or what
-        sphere.vertex_attributes["_CustomUInt16Scalar"] = g.np.random.randint(
-            0, 1000, size=(v_count, 1)
-        ).astype(g.np.uint16)
-        sphere.vertex_attributes["_CustomInt16Scalar"] = g.np.random.randint(
-            0, 1000, size=(v_count, 1)
-        ).astype(g.np.int16)
+        sphere.vertex_attributes["_CustomUInt16Scalar"] = rng.integers(
+            0, 1000, size=(v_count, 1), dtype=g.np.uint16
+        )
+        sphere.vertex_attributes["_CustomInt16Scalar"] = rng.integers(
+            0, 1000, size=(v_count, 1), dtype=g.np.int16
+        )
 
         # export as GLB then re-load
         export = sphere.export(file_type="glb")
@@ -593,7 +743,7 @@ class GLTFTest(g.unittest.TestCase):
 
     def test_extras(self):
         # if GLTF extras are defined, make sure they survive a round trip
-        s = g.get_mesh("cycloidal.3DXML")
+        s = g.get_mesh_cached("cycloidal.3DXML")
 
         scene_extensions = {"mesh_ext": {"ext_data": 1.23}}
         # some dummy data
@@ -606,8 +756,7 @@ class GLTFTest(g.unittest.TestCase):
         # export as GLB with extras passed to the exporter then re-load
         s.metadata = dummy
         export = s.export(file_type="glb")
-        validate_glb(export)
-        r = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        r = validate_reload(export)
 
         # make sure extras survived a round trip
         assert all(r.metadata[k] == v for k, v in dummy.items())
@@ -658,8 +807,7 @@ class GLTFTest(g.unittest.TestCase):
 
         # Check node extras survive a round trip
         export = s.export(file_type="glb")
-        validate_glb(export)
-        r = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        r = validate_reload(export)
         files = r.export(None, "gltf")
         gltf_data = files["model.gltf"]
         # Check that the mesh and node metadata/extras survived
@@ -761,14 +909,7 @@ class GLTFTest(g.unittest.TestCase):
         m = g.get_mesh("machinist.XAML")
         # export as GLB then re-import
         export = m.export(file_type="glb")
-        validate_glb(export)
-        r = next(
-            iter(
-                g.trimesh.load(
-                    g.trimesh.util.wrap_as_stream(export), file_type="glb"
-                ).geometry.values()
-            )
-        )
+        r = next(iter(validate_reload(export).geometry.values()))
         # original mesh should have vertex colors
         assert m.visual.kind == "face"
         assert g.np.ptp(g.np.ptp(m.visual.vertex_colors, axis=0)) > 0
@@ -777,21 +918,17 @@ class GLTFTest(g.unittest.TestCase):
 
     def test_vertex_attrib(self):
         # test concatenation with texture
-        m = g.get_mesh("fuze.obj")
+        m = g.get_mesh_cached("fuze.obj")
 
-        colors = (g.random((len(m.vertices), 4)) * 255).astype(g.np.uint8)
+        # seeded random colors generated directly as uint8
+        colors = g.np.random.default_rng(0).integers(
+            0, 256, size=(len(m.vertices), 4), dtype=g.np.uint8
+        )
 
         # set the color vertex attribute
         m.visual.vertex_attributes["color"] = colors
         export = m.export(file_type="glb", unitize_normals=True)
-        validate_glb(export)
-        r = next(
-            iter(
-                g.trimesh.load(
-                    g.trimesh.util.wrap_as_stream(export), file_type="glb"
-                ).geometry.values()
-            )
-        )
+        r = next(iter(validate_reload(export).geometry.values()))
 
         # make sure the color vertex attributes survived the roundtrip
         assert g.np.allclose(r.visual.vertex_attributes["color"], colors)
@@ -812,14 +949,14 @@ class GLTFTest(g.unittest.TestCase):
         gltf_2 = g.trimesh.exchange.gltf.export_gltf(scene, tree_postprocessor=add_unlit)
 
         def extract_materials(gltf_files):
-            return g.json.loads(gltf_files["model.gltf"].decode("utf8"))["materials"]
+            return g.json_loads(gltf_files["model.gltf"])["materials"]
 
         assert "extensions" not in extract_materials(gltf_1)[-1]
         assert "extensions" in extract_materials(gltf_2)[-1]
 
     def test_primitive_geometry_meta(self):
         # Model with primitives
-        s = g.get_mesh("CesiumMilkTruck.glb")
+        s = g.get_mesh_cached("CesiumMilkTruck.glb")
         # check to see if names are somewhat sane
         assert set(s.geometry.keys()) == {
             "Cesium_Milk_Truck",
@@ -836,7 +973,7 @@ class GLTFTest(g.unittest.TestCase):
         assert not s.geometry["Wheels"].metadata["from_gltf_primitive"]
 
         # make sure the flags survive being merged
-        m = g.get_mesh("CesiumMilkTruck.glb", merge_primitives=True)
+        m = g.get_mesh_cached("CesiumMilkTruck.glb", merge_primitives=True)
         # names should be non-insane
         assert set(m.geometry.keys()) == {"Cesium_Milk_Truck", "Wheels"}
         assert not s.geometry["Wheels"].metadata["from_gltf_primitive"]
@@ -846,8 +983,7 @@ class GLTFTest(g.unittest.TestCase):
         # test a simple pointcloud export-import cycle
         points = g.np.arange(30).reshape((-1, 3))
         export = g.trimesh.Scene(g.trimesh.PointCloud(points)).export(file_type="glb")
-        validate_glb(export)
-        reloaded = g.trimesh.load(g.trimesh.util.wrap_as_stream(export), file_type="glb")
+        reloaded = validate_reload(export)
         # make sure points survived export and reload
         assert g.np.allclose(next(iter(reloaded.geometry.values())).vertices, points)
 
@@ -859,50 +995,23 @@ class GLTFTest(g.unittest.TestCase):
         assert g.trimesh.tol.strict
 
         # check mesh, path, pointcloud exports
-        for root in [g.dir_models, g.os.path.join(g.dir_models, "2D")]:
-            for fn in g.os.listdir(root):
-                path_in = g.os.path.join(root, fn)
-                try:
-                    geom = g.trimesh.load(path_in)
-                    if isinstance(geom, g.trimesh.path.path.Path):
-                        geom = g.trimesh.Scene(geom)
-                except BaseException as E:
-                    g.log.debug(E)
-                    continue
-                # voxels don't have an export to gltf mode
-                if isinstance(geom, g.trimesh.voxel.VoxelGrid):
-                    try:
-                        geom.export(file_type="glb")
-                    except ValueError:
-                        # should have raised so all good
-                        continue
-                    raise ValueError("voxel was allowed to export wrong GLB!")
-                if hasattr(geom, "vertices") and len(geom.vertices) == 0:
-                    continue
-                if hasattr(geom, "geometry") and len(geom.geometry) == 0:
-                    continue
-
-                g.log.info(f"Testing: {fn}")
-                # check a roundtrip which will validate on export
-                # and crash on reload if we've done anything screwey
-                # unitize normals will unitize any normals to comply with
-                # the validator although there are probably reasons you'd
-                # want to roundtrip non-unit normals for things, stuff, and
-                # activities
-                export = geom.export(file_type="glb", unitize_normals=True)
-                validate_glb(export, name=fn)
-
-                # shouldn't crash on a reload
-                reloaded = g.trimesh.load(
-                    file_obj=g.trimesh.util.wrap_as_stream(export), file_type="glb"
-                )
-
-                if isinstance(geom, g.trimesh.Trimesh):
-                    assert g.np.isclose(geom.area, reloaded.area)
-
-                # compute some stuff
-                assert isinstance(reloaded.area, float)
-                assert isinstance(reloaded.duplicate_nodes, list)
+        paths = [
+            g.os.path.join(root, fn)
+            for root in [g.dir_models, g.os.path.join(g.dir_models, "2D")]
+            for fn in g.os.listdir(root)
+        ]
+        # the validator can be sampled locally to run on roughly every
+        # Nth export, picked by content hash so it is reproducible
+        every = max(1, int(g.os.environ.get("TRIMESH_BULK_VALIDATE_EVERY", 1)))
+        check = g.functools.partial(_check_bulk, every=every)
+
+        # every model is independent and the validator is a subprocess
+        # so threads overlap its runs while sharing the validated hashes
+        with g.concurrent.futures.ThreadPoolExecutor() as pool:
+            checked = list(pool.map(check, paths))
+
+        # make sure we actually exported something
+        assert any(checked)
 
     def test_interleaved(self):
         # do a quick check on a mesh that uses byte stride
@@ -922,13 +1031,10 @@ class GLTFTest(g.unittest.TestCase):
     def test_equal_by_default(self):
         # all things being equal we shouldn't be moving things
         # for the usual load-export loop
-        s = g.get_mesh("fuze.obj")
+        s = g.get_mesh_cached("fuze.obj")
         # export as GLB then re-load
         export = s.export(file_type="glb", unitize_normals=True)
-        validate_glb(export)
-        reloaded = g.trimesh.load(
-            g.trimesh.util.wrap_as_stream(export), file_type="glb", process=False
-        )
+        reloaded = validate_reload(export, process=False)
         assert len(reloaded.geometry) == 1
         m = next(iter(reloaded.geometry.values()))
         assert g.np.allclose(m.visual.uv, s.visual.uv)
@@ -983,17 +1089,14 @@ class GLTFTest(g.unittest.TestCase):
 
     def test_webp(self):
         # load textured file
-        mesh = g.get_mesh("fuze.ply")
+        mesh = g.get_mesh_cached("fuze.ply")
         assert hasattr(mesh.visual, "uv")
 
         for extension in ["glb"]:
             export = mesh.export(file_type=extension, extension_webp=True)
-            validate_glb(export)
 
             # roundtrip
-            reloaded = g.trimesh.load(
-                g.trimesh.util.wrap_as_stream(export), file_type=extension
-            )
+            reloaded = validate_reload(export)
 
             g.scene_equal(g.trimesh.Scene(mesh), reloaded)
 
@@ -1021,7 +1124,7 @@ class GLTFTest(g.unittest.TestCase):
 
     def test_postprocess(self):
         # check to see if keys we expect exist
-        s = g.get_mesh("cycloidal.3DXML")
+        s = g.get_mesh_cached("cycloidal.3DXML")
 
         def post(tree):
             # should have exported meshes here
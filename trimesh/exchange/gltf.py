@@ -7,8 +7,10 @@ as GL_TRIANGLES, and trimesh.Path2D/Path3D as GL_LINES
 """
 
 import base64
+import copy
 import json
 from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache
 
 import numpy as np
 
@@ -2078,8 +2080,8 @@ def validate(header):
     """
     Validate a GLTF 2.0 header against the schema.
 
-    Returns result from:
-    `jsonschema.validate(header, schema=get_schema())`
+    Equivalent to `jsonschema.validate(header, schema=get_schema())`
+    but uses a validator which is only constructed once.
 
     Parameters
     -------------
@@ -2092,14 +2094,39 @@ def validate(header):
       If the tree is an invalid GLTF2.0 header
     """
     # a soft dependency
+    from jsonschema.exceptions import best_match
+
+    # raise the most relevant error like `jsonschema.validate`
+    error = best_match(_schema_validator().iter_errors(header))
+    if error is not None:
+        raise error
+
+
+@lru_cache(maxsize=1)
+def _schema_validator():
+    """
+    Get a `jsonschema` validator for the GLTF 2.0 schema.
+
+    Checking the schema and constructing the validator is
+    most of the cost of `jsonschema.validate` so this is
+    only done once and then reused for every header.
+
+    Returns
+    ------------
+    validator : jsonschema.protocols.Validator
+      Validator for the dereferenced GLTF 2.0 schema.
+    """
+    # a soft dependency
     import jsonschema
 
     # will do the reference replacement
-    schema = get_schema()
-    # validate the passed header against the schema
-    valid = jsonschema.validate(header, schema=schema)
+    schema = _resolved_schema()
+    # pick the validator class from the schema's `$schema`
+    cls = jsonschema.validators.validator_for(schema)
+    # raises if the schema itself is malformed
+    cls.check_schema(schema)
 
-    return valid
+    return cls(schema)
 
 
 def get_schema():
@@ -2111,6 +2138,20 @@ def get_schema():
     schema : dict
       A copy of the GLTF 2.0 schema without external references.
     """
+    return copy.deepcopy(_resolved_schema())
+
+
+@lru_cache(maxsize=1)
+def _resolved_schema():
+    """
+    Load the GLTF 2.0 schema and resolve references once, this
+    is shared and should not be mutated: use `get_schema`.
+
+    Returns
+    ------------
+    schema : dict
+      The GLTF 2.0 schema without external references.
+    """
     # replace references
     # get zip resolver to access referenced assets
     from ..schemas import resolve